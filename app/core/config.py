@@ -43,6 +43,13 @@ class Settings(BaseSettings):
     BRIDGE_EVENT_TOKEN_TTL_SECONDS: int = 900
     SALES_CONTACT_EMAIL: str = "sales@ghostlink.io"
     DB_AUTO_INIT_ON_STARTUP: bool | None = None
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: int = 30
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    JINJA_BYTECODE_CACHE_DIR: str = ""
+    SITE_SCAN_CONCURRENCY: int = 4
+    SITE_SCAN_DETACHED: bool | None = None
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -89,6 +96,11 @@ class Settings(BaseSettings):
         # - production: skip heavy bootstrap and only validate DB connectivity
         if self.DB_AUTO_INIT_ON_STARTUP is None:
             self.DB_AUTO_INIT_ON_STARTUP = self.ENVIRONMENT != "production"
+
+        # Site scans run as detached tasks on long-lived workers; serverless
+        # invocations freeze once the response is sent, so keep them in-request.
+        if self.SITE_SCAN_DETACHED is None:
+            self.SITE_SCAN_DETACHED = not os.environ.get("VERCEL")
                  
         return self
 
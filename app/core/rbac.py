@@ -1,3 +1,4 @@
+import time
 from typing import Iterable, Optional
 
 from fastapi import HTTPException, Request
@@ -38,7 +39,76 @@ def parse_bool(raw_value: str | None, default: bool = False) -> bool:
 
 
 async def resolve_org_id_from_request(request: Request, key: str = "org_id") -> int:
-    return parse_org_id(await get_request_value(request, key))
+    # Memoize per request so repeated lookups skip query/form parsing.
+    cache = getattr(request.state, "_resolved_org_ids", None)
+    if cache is None:
+        cache = {}
+        request.state._resolved_org_ids = cache
+    if key in cache:
+        return cache[key]
+
+    org_id = parse_org_id(await get_request_value(request, key))
+    cache[key] = org_id
+    return org_id
+
+
+# Role lookups run on nearly every page render. Positive results are kept for
+# a short TTL; misses are never cached so new memberships apply immediately,
+# and removals invalidate explicitly via invalidate_membership_role(). That
+# invalidation only reaches the current worker, so the cache is for read-only
+# rendering: mutating endpoints authorize with use_cache=False or
+# require_org_membership().
+MEMBERSHIP_ROLE_TTL_SECONDS = 30.0
+_MEMBERSHIP_ROLE_CACHE_MAX = 10_000
+_membership_role_cache: dict[tuple[int, int], tuple[str, float]] = {}
+
+
+def cached_membership_role(org_id: int, user_id: int) -> str | None:
+    # Cache-only lookup for callers that fetch the role as part of a wider query.
+    cached = _membership_role_cache.get((org_id, user_id))
+    if cached is not None and cached[1] > time.monotonic():
+        return cached[0]
+    return None
+
+
+def remember_membership_role(org_id: int, user_id: int, role: str | None) -> None:
+    key = (org_id, user_id)
+    if role is None:
+        _membership_role_cache.pop(key, None)
+        return
+
+    if len(_membership_role_cache) >= _MEMBERSHIP_ROLE_CACHE_MAX:
+        _membership_role_cache.clear()
+    _membership_role_cache[key] = (role, time.monotonic() + MEMBERSHIP_ROLE_TTL_SECONDS)
+
+
+async def get_membership_role(
+    session: AsyncSession, org_id: int, user_id: int | None, use_cache: bool = True
+) -> str | None:
+    if user_id is None:
+        return None
+
+    if use_cache:
+        role = cached_membership_role(org_id, user_id)
+        if role is not None:
+            return role
+
+    role = (
+        await session.exec(
+            select(Membership.role).where(
+                and_(
+                    Membership.org_id == org_id,
+                    Membership.user_id == user_id,
+                )
+            )
+        )
+    ).first()
+    remember_membership_role(org_id, user_id, role)
+    return role
+
+
+def invalidate_membership_role(org_id: int, user_id: int) -> None:
+    _membership_role_cache.pop((org_id, user_id), None)
 
 
 async def require_org_membership(
@@ -63,6 +133,20 @@ async def require_org_membership(
     return membership
 
 
+async def require_org_role(
+    session: AsyncSession,
+    user: User,
+    org_id: int,
+    roles: Optional[Iterable[str]] = None,
+) -> str:
+    # Cached counterpart of require_org_membership for callers that only need
+    # the role, not the Membership row.
+    role = await get_membership_role(session, org_id, user.id)
+    if role is None or (roles and role not in roles):
+        raise HTTPException(status_code=403, detail="Access denied")
+    return role
+
+
 async def require_org_access(
     session: AsyncSession,
     user: User,
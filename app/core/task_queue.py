@@ -0,0 +1,77 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable
+
+from fastapi import BackgroundTasks
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class BoundedTaskQueue:
+    """Runs long background jobs as detached tasks with a concurrency cap.
+
+    BackgroundTasks run inside the request cycle after the response is sent,
+    so a multi-second job keeps that cycle (and its connection) busy. Detached
+    tasks release the request immediately; the semaphore keeps a burst of jobs
+    from monopolising the worker. When detached mode is off (serverless, where
+    work outside the request is frozen), jobs fall back to BackgroundTasks.
+    """
+
+    def __init__(self, name: str, concurrency: int, detached: bool):
+        self.name = name
+        self.detached = detached
+        self.concurrency = max(1, concurrency)
+        self._slots: asyncio.Semaphore | None = None
+        self._slots_loop: asyncio.AbstractEventLoop | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        # Semaphores bind to the loop that first waits on them; rebuild one per
+        # loop so test clients and reloads that spin up new loops stay safe.
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.concurrency)
+            self._slots_loop = loop
+        return self._slots
+
+    def add_task(
+        self,
+        background_tasks: BackgroundTasks,
+        func: Callable[..., Awaitable[Any]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        if not self.detached:
+            background_tasks.add_task(func, *args, **kwargs)
+            return
+
+        task = asyncio.create_task(self._run(func, *args, **kwargs))
+        # The event loop only keeps weak references to tasks.
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> None:
+        async with self._semaphore():
+            try:
+                await func(*args, **kwargs)
+            except Exception:
+                logger.exception("%s task %s failed", self.name, getattr(func, "__name__", func))
+
+    async def drain(self, timeout: float) -> None:
+        if not self._tasks:
+            return
+        pending = list(self._tasks)
+        _, still_running = await asyncio.wait(pending, timeout=timeout)
+        for task in still_running:
+            task.cancel()
+        if still_running:
+            logger.warning("Cancelled %d unfinished %s task(s) on shutdown", len(still_running), self.name)
+
+
+site_scan_queue = BoundedTaskQueue(
+    "site-scan",
+    concurrency=settings.SITE_SCAN_CONCURRENCY,
+    detached=bool(settings.SITE_SCAN_DETACHED),
+)
@@ -0,0 +1,8 @@
+from uvicorn.workers import UvicornWorker
+
+
+class UvloopUvicornWorker(UvicornWorker):
+    # The stock worker uses loop="auto", which silently falls back to the
+    # pure-asyncio loop when uvloop is missing. Pin uvloop/httptools so a
+    # production image without them fails at boot instead of running slower.
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools"}
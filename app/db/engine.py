@@ -4,7 +4,7 @@ from sqlalchemy import inspect, text
 from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import settings
@@ -14,6 +14,8 @@ def _is_postgres_url(database_url: str) -> bool:
     return database_url.startswith("postgresql") or database_url.startswith("postgres")
 
 
+_POOLER_PORTS = frozenset({6432, 6543})
+
 db_url = settings.DATABASE_URL
 db_url_obj = make_url(db_url)
 connect_args: dict = {}
@@ -27,10 +29,29 @@ if _is_postgres_url(db_url):
     connect_args["statement_cache_size"] = 0
     connect_args["prepared_statement_cache_size"] = 0
     connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+    # Short OLTP queries never benefit from JIT; skip its planning overhead.
+    # Poolers (PgBouncer sidecar on 6432, Supabase on 6543) reject unknown
+    # startup parameters, so behind them JIT is turned off on the server side.
+    if db_url_obj.port not in _POOLER_PORTS:
+        connect_args["server_settings"] = {"jit": "off"}
 
     # For Supabase pooler (6543), avoid SQLAlchemy connection reuse.
     if db_url_obj.port == 6543:
         engine_kwargs["poolclass"] = NullPool
+    else:
+        # Reuse warm connections (direct or via a PgBouncer sidecar on 6432) instead of
+        # paying TCP+TLS+auth per request; pre-ping/recycle drop stale sockets.
+        # LIFO checkout keeps bursts on the hottest connections and lets surplus
+        # overflow sockets idle out instead of being cycled back into rotation.
+        engine_kwargs.update(
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+            pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+            pool_pre_ping=True,
+            pool_use_lifo=True,
+        )
 
     if settings.ENVIRONMENT == "production":
         connect_args.setdefault("ssl", "require")
@@ -59,7 +80,7 @@ async def get_session() -> AsyncSession:
         
     duration = time.time() - start_time
     if duration > 0.2:
-         logger.warning(f"Slow DB Session: {duration:.4f}s")
+         logger.warning("Slow DB Session: %.4fs", duration)
 
 async def init_db():
     from sqlmodel import SQLModel
@@ -82,10 +103,13 @@ async def init_db():
         await conn.run_sync(_ensure_organization_columns)
         await conn.run_sync(_ensure_user_columns)
         await conn.run_sync(_ensure_analytics_columns)
+        await conn.run_sync(_ensure_search_indexes)
         await conn.run_sync(_ensure_optimization_columns)
         await conn.run_sync(_ensure_bandit_columns)
         await conn.run_sync(_ensure_approval_columns)
         await conn.run_sync(_ensure_subscription_columns)
+        # Last: table indexes may cover columns the steps above add to old databases.
+        await conn.run_sync(_ensure_composite_indexes)
 
 
 def _ensure_site_columns(sync_conn):
@@ -158,6 +182,55 @@ def _ensure_analytics_columns(sync_conn):
         sync_conn.execute(text(f"ALTER TABLE bridgeeventraw ADD COLUMN {column_name} {column_type}"))
 
 
+def _ensure_composite_indexes(sync_conn):
+    # create_all only emits indexes for tables it creates, so add composite
+    # indexes introduced later to existing databases here.
+    from app.models.analytics import BotVisit, BridgeEvent, BridgeEventRaw
+    from app.models.approval import ApprovalRequest
+    from app.models.billing import Invoice
+
+    for model in (BotVisit, BridgeEvent, BridgeEventRaw, ApprovalRequest, Invoice):
+        for index in model.__table__.indexes:
+            index.create(sync_conn, checkfirst=True)
+
+
+def _ensure_search_indexes(sync_conn):
+    # Admin CRM search runs lower(col) LIKE 'term%' per column (prefix) or
+    # '%term%' over one space-joined lower() blob per table (substring). On
+    # Postgres, text_pattern_ops btrees serve the prefix matches and a pg_trgm
+    # GIN index over the blob serves substrings in a single probe. The blob
+    # expressions must stay identical to _ORG/_USER_SEARCH_BLOB in pages.py.
+    if sync_conn.dialect.name != "postgresql":
+        return
+
+    prefix_indexes = {
+        "ix_organization_lower_name": "organization (lower(name) text_pattern_ops)",
+        "ix_organization_lower_slug": "organization (lower(slug) text_pattern_ops)",
+        "ix_organization_lower_billing_email": (
+            "organization (lower(coalesce(billing_email, '')) text_pattern_ops)"
+        ),
+        "ix_user_lower_email": '"user" (lower(email) text_pattern_ops)',
+        "ix_user_lower_full_name": '"user" ' "(lower(coalesce(full_name, '')) text_pattern_ops)",
+    }
+    for index_name, target in prefix_indexes.items():
+        sync_conn.execute(text(f"CREATE INDEX IF NOT EXISTS {index_name} ON {target}"))
+
+    statements = (
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        "CREATE INDEX IF NOT EXISTS ix_organization_search_trgm ON organization USING gin "
+        "((lower(name || ' ' || slug || ' ' || coalesce(billing_email, ''))) gin_trgm_ops)",
+        'CREATE INDEX IF NOT EXISTS ix_user_search_trgm ON "user" USING gin '
+        "((lower(email || ' ' || coalesce(full_name, ''))) gin_trgm_ops)",
+    )
+    try:
+        # Savepoint so a role without CREATE EXTENSION rights doesn't abort init_db.
+        with sync_conn.begin_nested():
+            for statement in statements:
+                sync_conn.execute(text(statement))
+    except Exception as exc:
+        logger.warning("Skipping admin search trigram indexes: %s", exc)
+
+
 def _ensure_optimization_columns(sync_conn):
     inspector = inspect(sync_conn)
     if "optimizationaction" not in inspector.get_table_names():
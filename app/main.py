@@ -19,10 +19,11 @@ async def lifespan(app: FastAPI):
     try:
         await init_db()
         logger.info("Database initialized successfully.")
+        from app.routers.pages import warm_template_cache
+
+        logger.info("Precompiled %d templates.", warm_template_cache())
     except Exception as e:
-        import traceback
-        logger.error(f"Startup Failure: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception("Startup Failure: %s", e)
         # We don't re-raise immediately so we can see the logs, 
         # but the app will likely be broken.
         # However, Vercel might kill it if we don't return yield?
@@ -30,6 +31,9 @@ async def lifespan(app: FastAPI):
         raise e
     yield
     logger.info("Shutting down...")
+    from app.core.task_queue import site_scan_queue
+
+    await site_scan_queue.drain(timeout=5.0)
 
 from starlette.middleware.sessions import SessionMiddleware
 from app.routers import (
@@ -1,9 +1,18 @@
 from typing import Optional
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 from datetime import datetime
 
 
 class BotVisit(SQLModel, table=True):
+    __table_args__ = (
+        # Covers the per-site bot/recency aggregates on the dashboard.
+        Index("ix_botvisit_site_bot_timestamp", "site_id", "bot_name", "timestamp"),
+        # Time-window counts per site (install signals, daily reports), where
+        # bot_name would otherwise sit between site_id and the range column.
+        Index("ix_botvisit_site_timestamp", "site_id", "timestamp"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     site_id: int = Field(index=True)
     bot_name: str = Field(index=True) # e.g., "GPTBot", "Google-Extended", "Human"
@@ -13,6 +22,11 @@ class BotVisit(SQLModel, table=True):
 
 
 class BridgeEvent(SQLModel, table=True):
+    __table_args__ = (
+        # Per-site recent-window counts (install signals, daily summaries).
+        Index("ix_bridgeevent_site_timestamp", "site_id", "timestamp"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     site_id: int = Field(index=True)
     session_id: Optional[str] = Field(default=None, index=True)
@@ -28,6 +42,11 @@ class BridgeEvent(SQLModel, table=True):
 
 
 class BridgeEventRaw(SQLModel, table=True):
+    __table_args__ = (
+        # Per-site 7-day ingestion health aggregates on the integration guide.
+        Index("ix_bridgeeventraw_site_created_at", "site_id", "created_at"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     site_id: int = Field(index=True)
     event_id: Optional[str] = Field(default=None, index=True)
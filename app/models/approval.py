@@ -1,10 +1,16 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlmodel import Field, SQLModel
+from sqlalchemy import Index
+from sqlmodel import Field, Relationship, SQLModel
 
 
 class ApprovalRequest(SQLModel, table=True):
+    __table_args__ = (
+        # Serves the per-org status counts and the newest-first pending inbox.
+        Index("ix_approvalrequest_org_status_created", "org_id", "status", "created_at"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     org_id: int = Field(index=True)
     request_type: str = Field(index=True)
@@ -24,3 +30,20 @@ class ApprovalRequest(SQLModel, table=True):
         default_factory=datetime.utcnow,
         sa_column_kwargs={"onupdate": datetime.utcnow},
     )
+
+    # Only populated when a query opts in (e.g. joinedload); lazy access raises
+    # so list views cannot silently fall back to one SELECT per row.
+    requested_by: Optional["User"] = Relationship(
+        sa_relationship_kwargs={
+            "foreign_keys": "[ApprovalRequest.requested_by_user_id]",
+            "lazy": "raise",
+            "viewonly": True,
+        }
+    )
+    reviewed_by: Optional["User"] = Relationship(
+        sa_relationship_kwargs={
+            "foreign_keys": "[ApprovalRequest.reviewed_by_user_id]",
+            "lazy": "raise",
+            "viewonly": True,
+        }
+    )
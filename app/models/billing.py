@@ -1,4 +1,5 @@
 from typing import Optional, List
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel, Relationship
 from datetime import datetime
 from enum import Enum
@@ -45,6 +46,11 @@ class PaymentMethod(SQLModel, table=True):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     
 class Invoice(SQLModel, table=True):
+    __table_args__ = (
+        # Latest-invoice-per-org lookups (ROW_NUMBER over org_id by created_at DESC).
+        Index("ix_invoice_org_created_at", "org_id", "created_at"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     org_id: int = Field(foreign_key="organization.id", index=True)
     stripe_invoice_id: str = Field(unique=True, index=True)
@@ -12,7 +12,12 @@ class Organization(SQLModel, table=True):
     preferred_language: Optional[str] = Field(default="auto", max_length=16)
     is_active: bool = Field(default=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    # onupdate stamps UTC on every UPDATE statement (including Core update()),
+    # in line with created_at rather than the server session's now().
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column_kwargs={"onupdate": datetime.utcnow},
+    )
     
     billing_email: Optional[str] = None
     
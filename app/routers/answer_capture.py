@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, Field
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.rbac import require_org_membership, resolve_org_id_from_request
+from app.core.rbac import require_org_membership, require_org_role, resolve_org_id_from_request
 from app.db.engine import get_session
 from app.models.user import User
 from app.routers.users import get_current_user
@@ -107,7 +107,7 @@ async def list_query_sets(
     if not user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     org_id = await resolve_org_id_from_request(request)
-    await require_org_membership(session, user, org_id)
+    await require_org_role(session, user, org_id)
 
     rows = await innovation_service.list_query_sets(session, org_id)
     return {"org_id": org_id, "query_sets": [_serialize_query_set(row) for row in rows]}
@@ -156,7 +156,7 @@ async def list_query_items(
     if not user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     org_id = await resolve_org_id_from_request(request)
-    await require_org_membership(session, user, org_id)
+    await require_org_role(session, user, org_id)
 
     query_set = await innovation_service.get_query_set(session, query_set_id, org_id)
     if not query_set:
@@ -265,7 +265,7 @@ async def list_runs(
     if not user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     org_id = await resolve_org_id_from_request(request)
-    await require_org_membership(session, user, org_id)
+    await require_org_role(session, user, org_id)
 
     rows = await innovation_service.list_runs(
         session=session,
@@ -286,7 +286,7 @@ async def get_run(
     if not user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     org_id = await resolve_org_id_from_request(request)
-    await require_org_membership(session, user, org_id)
+    await require_org_role(session, user, org_id)
 
     run = await innovation_service.get_run(session, org_id, run_id)
     if not run:
@@ -3,7 +3,7 @@ from typing import Any, Optional
 from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.rbac import get_request_value, require_org_membership, resolve_org_id_from_request
+from app.core.rbac import get_request_value, require_org_membership, require_org_role, resolve_org_id_from_request
 from app.db.engine import get_session
 from app.models.approval import ApprovalRequest
 from app.models.user import User
@@ -43,7 +43,7 @@ async def list_approvals(
         raise HTTPException(status_code=401, detail="Not authenticated")
 
     org_id = await resolve_org_id_from_request(request)
-    await require_org_membership(session, user, org_id)
+    await require_org_role(session, user, org_id)
 
     rows = await approval_service.list_requests(
         session=session,
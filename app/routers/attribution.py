@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, Field
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.rbac import require_org_membership, resolve_org_id_from_request
+from app.core.rbac import require_org_membership, require_org_role, resolve_org_id_from_request
 from app.db.engine import get_session
 from app.models.user import User
 from app.routers.users import get_current_user
@@ -98,7 +98,7 @@ async def get_snapshot(
     if not user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     org_id = await resolve_org_id_from_request(request)
-    await require_org_membership(session, user, org_id)
+    await require_org_role(session, user, org_id)
 
     snapshot = await innovation_service.compute_attribution_snapshot(
         session=session,
@@ -153,7 +153,7 @@ async def list_snapshots(
     if not user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     org_id = await resolve_org_id_from_request(request)
-    await require_org_membership(session, user, org_id)
+    await require_org_role(session, user, org_id)
 
     rows = await innovation_service.list_attribution_snapshots(
         session=session,
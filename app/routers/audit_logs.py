@@ -3,7 +3,7 @@ from typing import Any, Optional
 from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.rbac import require_org_membership, resolve_org_id_from_request
+from app.core.rbac import require_org_role, resolve_org_id_from_request
 from app.db.engine import get_session
 from app.models.user import User
 from app.routers.users import get_current_user
@@ -38,7 +38,7 @@ async def list_audit_logs(
         raise HTTPException(status_code=401, detail="Not authenticated")
 
     org_id = await resolve_org_id_from_request(request)
-    await require_org_membership(session, user, org_id, roles={"owner", "admin"})
+    await require_org_role(session, user, org_id, roles={"owner", "admin"})
 
     rows = await audit_service.list_logs(
         session=session,
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Request, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, HTTPException
 from fastapi.responses import RedirectResponse, JSONResponse
 from sqlmodel.ext.asyncio.session import AsyncSession
 from urllib.parse import quote
@@ -111,6 +111,7 @@ async def list_plans():
 @router.get("/current")
 async def get_current_subscription(
     request: Request,
+    background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_session),
     user: User = Depends(get_current_user)
 ):
@@ -127,7 +128,7 @@ async def get_current_subscription(
     upcoming_invoice = None
     if subscription_data["subscription"].stripe_customer_id:
         upcoming_invoice = await subscription_service.get_upcoming_invoice(
-            session, org_id
+            session, org_id, background_tasks=background_tasks
         )
 
     return {
@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, Field
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.rbac import require_org_membership, resolve_org_id_from_request
+from app.core.rbac import require_org_membership, require_org_role, resolve_org_id_from_request
 from app.db.engine import get_session
 from app.models.user import User
 from app.routers.users import get_current_user
@@ -63,7 +63,7 @@ async def list_policies(
     if not user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     org_id = await resolve_org_id_from_request(request)
-    await require_org_membership(session, user, org_id)
+    await require_org_role(session, user, org_id)
 
     rows = await compliance_service.list_policies(session, org_id, active_only=active_only)
     return {"org_id": org_id, "policies": [_serialize_policy(row) for row in rows]}
@@ -158,7 +158,7 @@ async def list_site_checks(
     if not user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     org_id = await resolve_org_id_from_request(request)
-    await require_org_membership(session, user, org_id)
+    await require_org_role(session, user, org_id)
 
     rows = await compliance_service.list_site_checks(
         session=session,
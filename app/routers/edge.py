@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, Field
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.rbac import require_org_membership, resolve_org_id_from_request
+from app.core.rbac import require_org_membership, require_org_role, resolve_org_id_from_request
 from app.db.engine import get_session
 from app.models.site import Site
 from app.models.user import User
@@ -173,7 +173,7 @@ async def list_deployments(
     if not user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     org_id = await resolve_org_id_from_request(request)
-    await require_org_membership(session, user, org_id)
+    await require_org_role(session, user, org_id)
     await _get_site_for_org(session, org_id, site_id)
 
     rows = await edge_service.list_deployments(
@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, Field
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.rbac import require_org_membership, resolve_org_id_from_request
+from app.core.rbac import require_org_membership, require_org_role, resolve_org_id_from_request
 from app.db.engine import get_session
 from app.models.user import User
 from app.routers.users import get_current_user
@@ -89,7 +89,7 @@ async def list_entities(
     if not user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     org_id = await resolve_org_id_from_request(request)
-    await require_org_membership(session, user, org_id)
+    await require_org_role(session, user, org_id)
 
     rows = await knowledge_graph_service.list_entities(session, org_id, entity_type=entity_type)
     return {"org_id": org_id, "entities": [_serialize_entity(row) for row in rows]}
@@ -142,7 +142,7 @@ async def list_relations(
     if not user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     org_id = await resolve_org_id_from_request(request)
-    await require_org_membership(session, user, org_id)
+    await require_org_role(session, user, org_id)
     rows = await knowledge_graph_service.list_relations(session, org_id)
     return {"org_id": org_id, "relations": [_serialize_relation(row) for row in rows]}
 
@@ -232,7 +232,7 @@ async def list_schema_drafts(
     if not user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     org_id = await resolve_org_id_from_request(request)
-    await require_org_membership(session, user, org_id)
+    await require_org_role(session, user, org_id)
     rows = await knowledge_graph_service.list_schema_drafts(session, org_id=org_id, site_id=site_id)
     return {"org_id": org_id, "site_id": site_id, "schema_drafts": [_serialize_schema_draft(row) for row in rows]}
 
@@ -1,11 +1,18 @@
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
-from pydantic import BaseModel, Field
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import and_, select
 from sqlmodel.ext.asyncio.session import AsyncSession
+import inspect
 import logging
+import random
 
-from app.core.rbac import get_request_value, require_org_membership, resolve_org_id_from_request
-from app.db.engine import get_session
+import orjson
+
+from app.core.rbac import get_request_value, require_org_membership, require_org_role, resolve_org_id_from_request
+from app.core.task_queue import site_scan_queue
+from app.db.engine import async_session_factory, get_session
 from app.models.optimization import OptimizationAction
 from app.models.site import Site
 from app.models.user import User
@@ -14,14 +21,36 @@ from app.routers.users import get_current_user
 from app.services.audit_service import audit_service
 from app.services.bandit_service import bandit_service
 from app.services.compliance_service import compliance_service
-from app.services.optimization_service import optimization_service
+from app.services.optimization_service import OptimizationServiceError, optimization_service
 
 
 router = APIRouter(prefix="/optimizations", tags=["optimizations"])
 logger = logging.getLogger(__name__)
 
+# Fraction of unexpected failures logged with a full traceback; formatting every
+# traceback during a downstream outage turns the error path into a CPU hog.
+UNEXPECTED_ERROR_TRACEBACK_SAMPLE_RATE = 0.01
+
+
+def _sample_traceback() -> bool:
+    return random.random() < UNEXPECTED_ERROR_TRACEBACK_SAMPLE_RATE
+
+
+# Mixed deployments may still ship an older service without the org_id keyword;
+# probe the signature once instead of retrying on TypeError per request.
+_GEN_SUPPORTS_ORG_ID = "org_id" in inspect.signature(optimization_service.generate_actions_for_site).parameters
+
+
+async def _generate_actions_for_site(session: AsyncSession, site: Site, org_id: int) -> list[OptimizationAction]:
+    kwargs = {"session": session, "site": site}
+    if _GEN_SUPPORTS_ORG_ID:
+        kwargs["org_id"] = org_id
+    return await optimization_service.generate_actions_for_site(**kwargs)
+
 
 class ActionFeedbackRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True, str_max_length=2000)
+
     reward: float = Field(ge=0.0, le=1.0)
     notes: str | None = None
 
@@ -90,21 +119,32 @@ async def list_actions(
         raise HTTPException(status_code=401, detail="Not authenticated")
 
     org_id = await resolve_org_id_from_request(request)
-    await require_org_membership(session, user, org_id)
+    await require_org_role(session, user, org_id)
     await _get_site_for_org(session, site_id, org_id)
 
-    actions = await optimization_service.list_actions(
-        session=session,
-        site_id=site_id,
-        org_id=org_id,
-        include_closed=include_closed,
+    return StreamingResponse(
+        _stream_actions_json(site_id, org_id, include_closed),
+        media_type="application/json",
     )
 
-    return {
-        "site_id": site_id,
-        "org_id": org_id,
-        "actions": [_serialize_action(action) for action in actions],
-    }
+
+async def _stream_actions_json(site_id: int, org_id: int, include_closed: bool):
+    yield b'{"site_id":%d,"org_id":%d,"actions":[' % (site_id, org_id)
+    # Request-scoped dependencies are torn down before a streamed body is sent,
+    # so rows are read through a session owned by the generator itself.
+    async with async_session_factory() as stream_session:
+        separator = b""
+        async for batch in optimization_service.stream_actions(
+            session=stream_session,
+            site_id=site_id,
+            org_id=org_id,
+            include_closed=include_closed,
+        ):
+            if not batch:
+                continue
+            yield separator + b",".join(orjson.dumps(_serialize_action(action)) for action in batch)
+            separator = b","
+    yield b"]}"
 
 
 @router.post("/sites/{site_id}/actions/generate")
@@ -122,20 +162,7 @@ async def generate_actions(
     site = await _get_site_for_org(session, site_id, org_id)
 
     try:
-        try:
-            created = await optimization_service.generate_actions_for_site(
-                session=session,
-                site=site,
-                org_id=org_id,
-            )
-        except TypeError as exc:
-            # Backward-compat shim for mixed deployments with older service signatures.
-            if "unexpected keyword argument 'org_id'" not in str(exc):
-                raise
-            created = await optimization_service.generate_actions_for_site(
-                session=session,
-                site=site,
-            )
+        created = await _generate_actions_for_site(session, site, org_id)
 
         actions = await optimization_service.list_actions(
             session=session,
@@ -144,7 +171,7 @@ async def generate_actions(
             include_closed=False,
         )
         serialized_actions = [_serialize_action(action) for action in actions]
-    except Exception as exc:
+    except (OptimizationServiceError, IntegrityError, TypeError) as exc:
         logger.exception(
             "Failed to generate optimization actions (site_id=%s, org_id=%s, user_id=%s)",
             site_id,
@@ -152,6 +179,16 @@ async def generate_actions(
             user.id if user else None,
         )
         raise HTTPException(status_code=500, detail=f"Generate actions failed: {str(exc)[:400]}")
+    except Exception as exc:
+        logger.error(
+            "Unexpected error generating optimization actions (site_id=%s, org_id=%s, user_id=%s): %s",
+            site_id,
+            org_id,
+            user.id if user else None,
+            exc,
+            exc_info=_sample_traceback(),
+        )
+        raise HTTPException(status_code=500, detail=f"Generate actions failed: {str(exc)[:400]}")
 
     await audit_service.log_event(
         session=session,
@@ -199,20 +236,22 @@ async def approve_action(
     if action.status not in {"pending", "approved"}:
         raise HTTPException(status_code=400, detail=f"Action cannot be approved from status: {action.status}")
 
-    policy_eval = await compliance_service.evaluate_text_against_active_policies(
-        session=session,
-        org_id=org_id,
-        text=action.proposed_instruction or "",
-        blocking_only=True,
-    )
-    if policy_eval["total_violations"] > 0:
-        raise HTTPException(
-            status_code=409,
-            detail={
-                "message": "Blocking compliance policy violations detected for optimization instruction",
-                "policy_results": policy_eval["results"],
-            },
+    # An empty instruction adds no content to the site, so there is nothing to vet.
+    if (action.proposed_instruction or "").strip():
+        policy_eval = await compliance_service.evaluate_text_against_active_policies(
+            session=session,
+            org_id=org_id,
+            text=action.proposed_instruction,
+            blocking_only=True,
         )
+        if policy_eval["total_violations"] > 0:
+            raise HTTPException(
+                status_code=409,
+                detail={
+                    "message": "Blocking compliance policy violations detected for optimization instruction",
+                    "policy_results": policy_eval["results"],
+                },
+            )
 
     try:
         site = await optimization_service.approve_and_apply_action(
@@ -224,7 +263,7 @@ async def approve_action(
         raise HTTPException(status_code=400, detail=str(exc))
     serialized_action = _serialize_action(action)
 
-    background_tasks.add_task(process_site_background, site.id)
+    site_scan_queue.add_task(background_tasks, process_site_background, site.id)
     await audit_service.log_event(
         session=session,
         org_id=org_id,
@@ -271,20 +310,7 @@ async def decide_next_action_v2(
         )
         selected_action = decision.get("selected_action")
         if ensure_candidates and not selected_action:
-            try:
-                created = await optimization_service.generate_actions_for_site(
-                    session=session,
-                    site=site,
-                    org_id=org_id,
-                )
-            except TypeError as exc:
-                if "unexpected keyword argument 'org_id'" not in str(exc):
-                    raise
-                created = await optimization_service.generate_actions_for_site(
-                    session=session,
-                    site=site,
-                )
-
+            created = await _generate_actions_for_site(session, site, org_id)
             created_count = len(created)
             if created_count > 0:
                 decision = await bandit_service.decide_next_action(
@@ -296,7 +322,7 @@ async def decide_next_action_v2(
                     context={"source": "api_bootstrap"},
                 )
                 selected_action = decision.get("selected_action")
-    except Exception as exc:
+    except (OptimizationServiceError, IntegrityError, TypeError) as exc:
         logger.exception(
             "Failed to run v2 decision (site_id=%s, org_id=%s, user_id=%s)",
             site_id,
@@ -304,6 +330,16 @@ async def decide_next_action_v2(
             user.id if user else None,
         )
         raise HTTPException(status_code=500, detail=f"v2 decision failed: {str(exc)[:400]}")
+    except Exception as exc:
+        logger.error(
+            "Unexpected error running v2 decision (site_id=%s, org_id=%s, user_id=%s): %s",
+            site_id,
+            org_id,
+            user.id if user else None,
+            exc,
+            exc_info=_sample_traceback(),
+        )
+        raise HTTPException(status_code=500, detail=f"v2 decision failed: {str(exc)[:400]}")
     selected_action_id = decision.get("selected_action_id")
     if not selected_action_id:
         scored_candidates = decision.get("scored_candidates") or []
@@ -355,7 +391,7 @@ async def list_bandit_arms(
         raise HTTPException(status_code=401, detail="Not authenticated")
 
     org_id = await resolve_org_id_from_request(request)
-    await require_org_membership(session, user, org_id)
+    await require_org_role(session, user, org_id)
     await _get_site_for_org(session, site_id, org_id)
 
     arms = await bandit_service.list_arms(
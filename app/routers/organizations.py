@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import exists, insert, update
 from sqlmodel import select, and_, func
 from typing import List
-from datetime import datetime
+from app.core.rbac import invalidate_membership_role
 from app.db.engine import get_session
 from app.models.user import User
 from app.models.organization import Organization, Membership, OrganizationCreate, OrganizationRead, OrganizationUpdate
@@ -22,22 +23,70 @@ def generate_org_slug(name: str) -> str:
     return f"{base}-{suffix}"
 
 
-async def _enforce_team_member_limit(session: AsyncSession, org_id: int):
-    subscription = await subscription_service.get_or_create_subscription(session, org_id)
-    team_limit = get_plan_limit(subscription.plan_code, "team_members")
+async def _enforce_team_member_limit(
+    session: AsyncSession,
+    org_id: int,
+    plan_code: str | None = None,
+    current_members: int | None = None,
+):
+    if plan_code is None:
+        subscription = await subscription_service.get_or_create_subscription(session, org_id)
+        plan_code = subscription.plan_code
+    team_limit = get_plan_limit(plan_code, "team_members")
     if team_limit == -1:
         return
 
-    result = await session.exec(
-        select(func.count(Membership.user_id)).where(Membership.org_id == org_id)
-    )
-    current_members = result.one() or 0
+    if current_members is None:
+        result = await session.exec(
+            select(func.count(Membership.user_id)).where(Membership.org_id == org_id)
+        )
+        current_members = result.one() or 0
     if current_members >= team_limit:
         raise HTTPException(
             status_code=403,
             detail=f"Team member limit reached ({team_limit}). Upgrade your plan to invite more members."
         )
 
+
+async def _load_invite_context(session: AsyncSession, org_id: int, inviter_id: int, email: str):
+    """Fetch everything invite_member needs to decide in a single round-trip."""
+    invited_user_id = (
+        select(User.id).where(User.email == email).limit(1).scalar_subquery()
+    )
+    inviter_role = (
+        select(Membership.role)
+        .where(
+            and_(
+                Membership.org_id == org_id,
+                Membership.user_id == inviter_id,
+                Membership.role.in_(["owner", "admin"])
+            )
+        )
+        .limit(1)
+        .scalar_subquery()
+    )
+    already_member = exists().where(
+        and_(
+            Membership.org_id == org_id,
+            Membership.user_id == invited_user_id
+        )
+    )
+    member_count = (
+        select(func.count(Membership.user_id))
+        .where(Membership.org_id == org_id)
+        .scalar_subquery()
+    )
+    plan_code = (
+        select(Subscription.plan_code)
+        .where(Subscription.org_id == org_id)
+        .limit(1)
+        .scalar_subquery()
+    )
+    result = await session.exec(
+        select(inviter_role, invited_user_id, already_member, member_count, plan_code)
+    )
+    return result.one()
+
 @router.post("", response_model=OrganizationRead)
 async def create_organization(
     org_data: OrganizationCreate,
@@ -56,17 +105,18 @@ async def create_organization(
     else:
         org_data.slug = generate_org_slug(org_data.name)
     
-    org = Organization(
-        name=org_data.name,
-        slug=org_data.slug,
-        description=org_data.description,
-        website=org_data.website,
-        billing_email=user.email
+    result = await session.execute(
+        insert(Organization)
+        .values(
+            name=org_data.name,
+            slug=org_data.slug,
+            description=org_data.description,
+            website=org_data.website,
+            billing_email=user.email
+        )
+        .returning(Organization)
     )
-    
-    session.add(org)
-    await session.commit()
-    await session.refresh(org)
+    org = result.scalars().one()
     
     membership = Membership(
         org_id=org.id,
@@ -157,30 +207,37 @@ async def update_organization(
     if not membership.first():
         raise HTTPException(status_code=403, detail="Access denied")
     
-    result = await session.exec(
-        select(Organization).where(Organization.id == org_id)
-    )
-    org = result.first()
-    
-    if not org:
-        raise HTTPException(status_code=404, detail="Organization not found")
-    
+    changes = {}
     if org_data.name:
-        org.name = org_data.name
+        changes["name"] = org_data.name
     if org_data.description is not None:
-        org.description = org_data.description
+        changes["description"] = org_data.description
     if org_data.website is not None:
-        org.website = org_data.website
+        changes["website"] = org_data.website
     if org_data.avatar_url is not None:
-        org.avatar_url = org_data.avatar_url
+        changes["avatar_url"] = org_data.avatar_url
     if org_data.billing_email is not None:
-        org.billing_email = org_data.billing_email
+        changes["billing_email"] = org_data.billing_email
+    
+    if not changes:
+        # No-op patch: skip the write entirely and hand back the current row.
+        org = await session.get(Organization, org_id)
+        if not org:
+            raise HTTPException(status_code=404, detail="Organization not found")
+        return org
+    
+    result = await session.execute(
+        update(Organization)
+        .where(Organization.id == org_id)
+        .values(**changes)
+        .returning(Organization)
+    )
+    org = result.scalars().first()
     
-    org.updated_at = datetime.utcnow()
+    if not org:
+        raise HTTPException(status_code=404, detail="Organization not found")
     
-    session.add(org)
     await session.commit()
-    await session.refresh(org)
     
     return org
 
@@ -238,48 +295,33 @@ async def invite_member(
     if role not in ["member", "admin"]:
         raise HTTPException(status_code=400, detail="Invalid role")
     
-    membership = await session.exec(
-        select(Membership).where(
-            and_(
-                Membership.org_id == org_id,
-                Membership.user_id == user.id,
-                Membership.role.in_(["owner", "admin"])
-            )
-        )
+    inviter_role, invited_user_id, already_member, member_count, plan_code = await _load_invite_context(
+        session, org_id, user.id, email
     )
     
-    if not membership.first():
+    if not inviter_role:
         raise HTTPException(status_code=403, detail="Access denied")
     
-    existing_user = await session.exec(
-        select(User).where(User.email == email)
-    )
-    invited_user = existing_user.first()
-    
-    if invited_user:
-        existing_membership = await session.exec(
-            select(Membership).where(
-                and_(
-                    Membership.org_id == org_id,
-                    Membership.user_id == invited_user.id
-                )
-            )
-        )
-        
-        if existing_membership.first():
+    if invited_user_id:
+        if already_member:
             raise HTTPException(status_code=400, detail="User is already a member")
 
-        await _enforce_team_member_limit(session, org_id)
+        await _enforce_team_member_limit(
+            session,
+            org_id,
+            plan_code=plan_code,
+            current_members=member_count or 0,
+        )
         
         new_membership = Membership(
             org_id=org_id,
-            user_id=invited_user.id,
+            user_id=invited_user_id,
             role=role
         )
         session.add(new_membership)
         await session.commit()
         
-        return {"status": "added", "user_id": invited_user.id}
+        return {"status": "added", "user_id": invited_user_id}
     else:
         return {"status": "invited", "email": email}
 
@@ -330,5 +372,6 @@ async def remove_member(
     
     await session.delete(target)
     await session.commit()
+    invalidate_membership_role(org_id, member_id)
     
     return {"status": "removed"}
@@ -6,6 +6,8 @@ from fastapi.responses import JSONResponse
 from sqlalchemy.orm import sessionmaker
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel import select, and_, func
+from app.core.rbac import get_membership_role
+from app.core.task_queue import site_scan_queue
 from app.db.engine import engine, get_session
 from app.models.site import Site
 from app.models.user import User
@@ -102,18 +104,11 @@ async def process_site_background(site_id: int, language: str | None = None):
 async def get_org_id_for_user(
     session: AsyncSession,
     user: User,
-    requested_org_id: int = None
+    requested_org_id: int = None,
+    use_cache: bool = True,
 ) -> int:
     if requested_org_id:
-        membership = await session.exec(
-            select(Membership).where(
-                and_(
-                    Membership.org_id == requested_org_id,
-                    Membership.user_id == user.id
-                )
-            )
-        )
-        if membership.first():
+        if await get_membership_role(session, requested_org_id, user.id, use_cache=use_cache) is not None:
             return requested_org_id
         raise HTTPException(status_code=403, detail="Access denied to organization")
     
@@ -158,7 +153,7 @@ async def add_site(
     if not current_user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     
-    effective_org_id = await get_org_id_for_user(session, current_user, org_id)
+    effective_org_id = await get_org_id_for_user(session, current_user, org_id, use_cache=False)
     
     subscription = await subscription_service.get_or_create_subscription(
         session, effective_org_id
@@ -224,7 +219,7 @@ async def add_site(
         should_start_processing = True
 
     if should_start_processing:
-        background_tasks.add_task(process_site_background, site.id)
+        site_scan_queue.add_task(background_tasks, process_site_background, site.id)
 
     _hydrate_site_language(site, request.headers.get("accept-language"))
     return templates.TemplateResponse(
@@ -250,7 +245,7 @@ async def update_org_language(
     if not current_user:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
-    effective_org_id = await get_org_id_for_user(session, current_user, org_id)
+    effective_org_id = await get_org_id_for_user(session, current_user, org_id, use_cache=False)
     membership = await _get_membership(session, effective_org_id, current_user.id)
     if not membership or membership.role not in {"owner", "admin"}:
         raise HTTPException(status_code=403, detail="Only owner/admin can change org language")
@@ -301,7 +296,7 @@ async def update_org_language(
                     break
                 should_start_processing = await _set_site_pending(site, session)
                 if should_start_processing:
-                    background_tasks.add_task(process_site_background, site.id)
+                    site_scan_queue.add_task(background_tasks, process_site_background, site.id)
                     started_rescans += 1
 
             quota_skipped = max(0, len(candidates) - started_rescans)
@@ -331,7 +326,7 @@ async def delete_site(
     if not current_user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     
-    effective_org_id = await get_org_id_for_user(session, current_user, org_id)
+    effective_org_id = await get_org_id_for_user(session, current_user, org_id, use_cache=False)
     
     from app.routers.bridge import invalidate_script_cache
 
@@ -361,7 +356,7 @@ async def generate_site_assets(
     if not current_user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     
-    effective_org_id = await get_org_id_for_user(session, current_user, org_id)
+    effective_org_id = await get_org_id_for_user(session, current_user, org_id, use_cache=False)
     
     site = await session.get(Site, site_id)
     if not site:
@@ -395,7 +390,7 @@ async def generate_site_assets(
 
     should_start_processing = await _set_site_pending(site, session)
     if should_start_processing:
-        background_tasks.add_task(process_site_background, site.id)
+        site_scan_queue.add_task(background_tasks, process_site_background, site.id)
 
     _hydrate_site_language(site, request.headers.get("accept-language"))
     template_name = _resolve_site_template(request)
@@ -422,7 +417,7 @@ async def update_site_language(
     if not current_user:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
-    effective_org_id = await get_org_id_for_user(session, current_user, org_id)
+    effective_org_id = await get_org_id_for_user(session, current_user, org_id, use_cache=False)
 
     site = await session.get(Site, site_id)
     if not site:
@@ -455,7 +450,7 @@ async def update_site_language(
         await session.refresh(site)
 
     if should_start_processing:
-        background_tasks.add_task(process_site_background, site.id)
+        site_scan_queue.add_task(background_tasks, process_site_background, site.id)
 
     _hydrate_site_language(site, request.headers.get("accept-language"))
     template_name = _resolve_site_template(request)
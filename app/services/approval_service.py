@@ -1,10 +1,12 @@
 import json
+import time
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 from urllib.parse import quote
 
+import orjson
 from fastapi import HTTPException
-from sqlmodel import and_, select
+from sqlmodel import and_, func, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.billing.plan_compat import is_valid_plan_code, normalize_plan_code
@@ -23,6 +25,14 @@ class ApprovalService:
         "billing_cancel",
         "billing_reactivate",
     }
+    # Status counts back the pending badge on every page; a short process-local
+    # TTL collapses repeated GROUP BYs per org, and this service's own writes
+    # invalidate it.
+    STATUS_COUNTS_TTL_SECONDS = 10.0
+    _STATUS_COUNTS_CACHE_MAX = 10_000
+
+    def __init__(self):
+        self._status_counts_cache: dict[int, tuple[dict[str, int], float]] = {}
 
     def _normalize_request_type(self, request_type: str) -> str:
         req_type = (request_type or "").strip().lower()
@@ -77,7 +87,7 @@ class ApprovalService:
         request_row = ApprovalRequest(
             org_id=org_id,
             request_type=req_type,
-            request_payload=json.dumps(normalized_payload, ensure_ascii=True),
+            request_payload=orjson.dumps(normalized_payload).decode(),
             status="pending",
             requested_by_user_id=requested_by_user_id,
             requester_note=requester_note,
@@ -85,6 +95,7 @@ class ApprovalService:
         session.add(request_row)
         await session.commit()
         await session.refresh(request_row)
+        self.invalidate_status_counts(request_row.org_id)
 
         await audit_service.log_event(
             session=session,
@@ -108,8 +119,11 @@ class ApprovalService:
         org_id: int,
         status: Optional[str] = None,
         limit: Optional[int] = None,
+        load_options: Sequence[Any] = (),
     ) -> list[ApprovalRequest]:
         query = select(ApprovalRequest).where(ApprovalRequest.org_id == org_id)
+        if load_options:
+            query = query.options(*load_options)
         if status:
             query = query.where(ApprovalRequest.status == status)
         query = query.order_by(ApprovalRequest.created_at.desc())
@@ -118,6 +132,38 @@ class ApprovalService:
         result = await session.exec(query)
         return result.all()
 
+    async def status_counts(self, session: AsyncSession, org_id: int) -> dict[str, int]:
+        now = time.monotonic()
+        cached = self._status_counts_cache.get(org_id)
+        if cached is not None and cached[1] > now:
+            return dict(cached[0])
+
+        counts = {
+            "all": 0,
+            "pending": 0,
+            "approved": 0,
+            "rejected": 0,
+            "failed": 0,
+        }
+        result = await session.exec(
+            select(ApprovalRequest.status, func.count())
+            .where(ApprovalRequest.org_id == org_id)
+            .group_by(ApprovalRequest.status)
+        )
+        for status_value, count_value in result.all():
+            status_key = str(status_value or "").strip().lower()
+            if status_key in counts:
+                counts[status_key] = int(count_value or 0)
+        counts["all"] = counts["pending"] + counts["approved"] + counts["rejected"] + counts["failed"]
+
+        if len(self._status_counts_cache) >= self._STATUS_COUNTS_CACHE_MAX:
+            self._status_counts_cache.clear()
+        self._status_counts_cache[org_id] = (counts, now + self.STATUS_COUNTS_TTL_SECONDS)
+        return dict(counts)
+
+    def invalidate_status_counts(self, org_id: int) -> None:
+        self._status_counts_cache.pop(org_id, None)
+
     async def get_request(
         self,
         session: AsyncSession,
@@ -134,14 +180,21 @@ class ApprovalService:
         )
         return result.first()
 
-    def _parse_payload(self, request_row: ApprovalRequest) -> dict[str, Any]:
+    def _loads_dict(self, raw: Optional[str]) -> dict[str, Any]:
+        if not raw:
+            return {}
         try:
-            payload = json.loads(request_row.request_payload or "{}")
-        except Exception:
-            payload = {}
-        if not isinstance(payload, dict):
-            payload = {}
-        return payload
+            parsed = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # Rows written by json.dumps may carry NaN/Infinity, which orjson rejects.
+            try:
+                parsed = json.loads(raw)
+            except Exception:
+                return {}
+        return parsed if isinstance(parsed, dict) else {}
+
+    def _parse_payload(self, request_row: ApprovalRequest) -> dict[str, Any]:
+        return self._loads_dict(request_row.request_payload)
 
     async def _execute_billing_plan_change(
         self,
@@ -309,22 +362,24 @@ class ApprovalService:
             request_row.reviewed_by_user_id = reviewer.id
             request_row.reviewed_at = datetime.utcnow()
             request_row.review_note = review_note
-            request_row.execution_result = json.dumps({"error": str(exc)[:500]}, ensure_ascii=True)
+            request_row.execution_result = orjson.dumps({"error": str(exc)[:500]}).decode()
             request_row.updated_at = datetime.utcnow()
             session.add(request_row)
             await session.commit()
             await session.refresh(request_row)
+            self.invalidate_status_counts(request_row.org_id)
             raise
 
         request_row.status = "approved"
         request_row.reviewed_by_user_id = reviewer.id
         request_row.reviewed_at = datetime.utcnow()
         request_row.review_note = review_note
-        request_row.execution_result = json.dumps(result_payload, ensure_ascii=True)
+        request_row.execution_result = orjson.dumps(result_payload).decode()
         request_row.updated_at = datetime.utcnow()
         session.add(request_row)
         await session.commit()
         await session.refresh(request_row)
+        self.invalidate_status_counts(request_row.org_id)
 
         await audit_service.log_event(
             session=session,
@@ -360,6 +415,7 @@ class ApprovalService:
         session.add(request_row)
         await session.commit()
         await session.refresh(request_row)
+        self.invalidate_status_counts(request_row.org_id)
 
         await audit_service.log_event(
             session=session,
@@ -377,13 +433,7 @@ class ApprovalService:
         return request_row
 
     def parse_execution_result(self, request_row: ApprovalRequest) -> dict[str, Any]:
-        if not request_row.execution_result:
-            return {}
-        try:
-            parsed = json.loads(request_row.execution_result)
-            return parsed if isinstance(parsed, dict) else {}
-        except Exception:
-            return {}
+        return self._loads_dict(request_row.execution_result)
 
     def parse_request_payload(self, request_row: ApprovalRequest) -> dict[str, Any]:
         return self._parse_payload(request_row)
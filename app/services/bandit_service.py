@@ -38,8 +38,10 @@ class BanditService:
         session: AsyncSession,
         org_id: int,
         site_id: int,
+        actions: Optional[list[OptimizationAction]] = None,
     ) -> list[OptimizationBanditArm]:
-        actions = await self._get_pending_actions(session, org_id, site_id)
+        if actions is None:
+            actions = await self._get_pending_actions(session, org_id, site_id)
         if not actions:
             return []
 
@@ -76,15 +78,14 @@ class BanditService:
 
         return [row for row in existing if row.action_id in {a.id for a in actions}]
 
-    def _score_arm(self, arm: OptimizationBanditArm, strategy: str) -> float:
+    def _score_arms(self, arms: list[OptimizationBanditArm], strategy: str) -> list[float]:
+        # Score every candidate in one pass; arm counts per site are small, so a
+        # tight loop over a locally bound sampler beats pulling in NumPy.
         if strategy == "ucb":
-            total_pulls = max(arm.pulls, 1)
-            exploration = (2.0 * (1.0 / total_pulls)) ** 0.5
-            return arm.average_reward + exploration
+            return [arm.average_reward + (2.0 / max(arm.pulls, 1)) ** 0.5 for arm in arms]
         # default thompson sampling
-        alpha = max(arm.alpha, 0.001)
-        beta = max(arm.beta, 0.001)
-        return random.betavariate(alpha, beta)
+        betavariate = random.betavariate
+        return [betavariate(max(arm.alpha, 0.001), max(arm.beta, 0.001)) for arm in arms]
 
     async def decide_next_action(
         self,
@@ -104,14 +105,13 @@ class BanditService:
             return {"selected_action": None, "scored_candidates": [], "strategy": strategy_name}
 
         action_by_id = {row.id: row for row in actions}
-        arms = await self.ensure_arms_for_site(session, org_id, site_id)
+        arms = await self.ensure_arms_for_site(session, org_id, site_id, actions=actions)
+        arms = [arm for arm in arms if arm.action_id in action_by_id]
+        scores = self._score_arms(arms, strategy_name)
 
         scored_candidates: list[dict[str, Any]] = []
-        for arm in arms:
-            action = action_by_id.get(arm.action_id)
-            if not action:
-                continue
-            score = self._score_arm(arm, strategy_name)
+        for arm, score in zip(arms, scores):
+            action = action_by_id[arm.action_id]
             scored_candidates.append(
                 {
                     "action_id": action.id,
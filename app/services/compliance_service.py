@@ -1,4 +1,5 @@
 import json
+from functools import lru_cache
 from typing import Any, Optional
 
 from sqlmodel import and_, select
@@ -8,15 +9,44 @@ from app.models.innovation_plus import ComplianceCheckRun, CompliancePolicy
 from app.models.site import Site
 
 
+_PhraseList = tuple[tuple[str, str], ...]
+_CompiledRules = tuple[_PhraseList, _PhraseList, int, int]
+
+
+def _compile_phrases(raw_phrases: Any) -> _PhraseList:
+    phrases = (str(x).strip() for x in raw_phrases or [])
+    return tuple((phrase, phrase.lower()) for phrase in phrases if phrase)
+
+
+def _compile_rules(rules: dict[str, Any]) -> _CompiledRules:
+    return (
+        _compile_phrases(rules.get("banned_phrases", [])),
+        _compile_phrases(rules.get("required_phrases", [])),
+        int(rules.get("min_length", 0) or 0),
+        int(rules.get("max_length", 0) or 0),
+    )
+
+
+def _parse_rules(raw: str | None) -> dict[str, Any]:
+    if not raw:
+        return {}
+    try:
+        parsed = json.loads(raw)
+        return parsed if isinstance(parsed, dict) else {}
+    except Exception:
+        return {}
+
+
+@lru_cache(maxsize=512)
+def _compiled_policy_rules(raw: str | None) -> _CompiledRules:
+    # Policies are immutable per rules_json payload, so parse/normalize once
+    # and reuse across approve_action and other per-request checks.
+    return _compile_rules(_parse_rules(raw))
+
+
 class ComplianceService:
     def parse_rules(self, raw: str | None) -> dict[str, Any]:
-        if not raw:
-            return {}
-        try:
-            parsed = json.loads(raw)
-            return parsed if isinstance(parsed, dict) else {}
-        except Exception:
-            return {}
+        return _parse_rules(raw)
 
     def parse_violations(self, raw: str | None) -> list[dict[str, Any]]:
         if not raw:
@@ -74,17 +104,17 @@ class ComplianceService:
         return row
 
     def evaluate_text(self, text: str, rules: dict[str, Any]) -> list[dict[str, Any]]:
+        return self._evaluate_compiled(text, _compile_rules(rules))
+
+    def _evaluate_compiled(self, text: str, compiled: "_CompiledRules") -> list[dict[str, Any]]:
         value = (text or "").strip()
         lowered = value.lower()
         violations: list[dict[str, Any]] = []
 
-        banned_phrases = [str(x).strip() for x in rules.get("banned_phrases", []) if str(x).strip()]
-        required_phrases = [str(x).strip() for x in rules.get("required_phrases", []) if str(x).strip()]
-        min_length = int(rules.get("min_length", 0) or 0)
-        max_length = int(rules.get("max_length", 0) or 0)
+        banned_phrases, required_phrases, min_length, max_length = compiled
 
-        for phrase in banned_phrases:
-            if phrase.lower() in lowered:
+        for phrase, phrase_lower in banned_phrases:
+            if phrase_lower in lowered:
                 violations.append(
                     {
                         "type": "banned_phrase",
@@ -93,8 +123,8 @@ class ComplianceService:
                     }
                 )
 
-        for phrase in required_phrases:
-            if phrase.lower() not in lowered:
+        for phrase, phrase_lower in required_phrases:
+            if phrase_lower not in lowered:
                 violations.append(
                     {
                         "type": "required_phrase_missing",
@@ -202,8 +232,7 @@ class ComplianceService:
         results = []
         total_violations = 0
         for policy in policies:
-            rules = self.parse_rules(policy.rules_json)
-            violations = self.evaluate_text(text, rules)
+            violations = self._evaluate_compiled(text, _compiled_policy_rules(policy.rules_json))
             total_violations += len(violations)
             results.append(
                 {
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Dict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping
 
 
 _MESSAGES_EN: Dict[str, str] = {
@@ -527,10 +529,15 @@ def _canonical_lang(language_code: str | None) -> str:
     return "en"
 
 
-def get_i18n_messages(language_code: str | None) -> Dict[str, str]:
-    lang = _canonical_lang(language_code)
+@lru_cache(maxsize=None)
+def _merged_messages(lang: str) -> Mapping[str, str]:
     merged = dict(_MESSAGES_EN)
     overrides = _LANGUAGE_OVERRIDES.get(lang)
     if overrides:
         merged.update(overrides)
-    return merged
+    return MappingProxyType(merged)
+
+
+def get_i18n_messages(language_code: str | None) -> Mapping[str, str]:
+    # One shared read-only table per language instead of a fresh merge per render.
+    return _merged_messages(_canonical_lang(language_code))
@@ -1,5 +1,7 @@
+import heapq
 import json
 from datetime import datetime, timedelta
+from operator import itemgetter
 from typing import Any, Optional
 from urllib.parse import urlparse
 
@@ -392,11 +394,10 @@ class InnovationService:
             "ai_assist_rate_pct": ai_assist_rate,
             "ai_event_count": len([row for row in rows if row.source_type == "ai"]),
             "total_event_count": len(rows),
-            "top_ai_bots": sorted(
-                [{"bot_name": k, "count": v} for k, v in by_bot.items()],
-                key=lambda x: x["count"],
-                reverse=True,
-            )[:10],
+            "top_ai_bots": [
+                {"bot_name": k, "count": v}
+                for k, v in heapq.nlargest(10, by_bot.items(), key=itemgetter(1))
+            ],
         }
 
     async def save_attribution_snapshot(
@@ -104,39 +104,40 @@ COUNTRY_DEFAULT_LANGUAGE: dict[str, str] = {
     "sg": "en",
 }
 
+LANGUAGE_ALIASES: dict[str, str] = {
+    "english": "en",
+    "korean": "ko",
+    "japanese": "ja",
+    "chinese": "zh-cn",
+    "chinese-simplified": "zh-cn",
+    "chinese-traditional": "zh-tw",
+    "spanish": "es",
+    "french": "fr",
+    "german": "de",
+    "portuguese": "pt-br",
+    "portuguese-br": "pt-br",
+    "italian": "it",
+    "russian": "ru",
+    "arabic": "ar",
+    "hindi": "hi",
+    "vietnamese": "vi",
+    "thai": "th",
+    "indonesian": "id",
+    "turkish": "tr",
+    "dutch": "nl",
+    "polish": "pl",
+    "zh_cn": "zh-cn",
+    "zh_tw": "zh-tw",
+    "pt_br": "pt-br",
+}
+
 
 def normalize_language_preference(value: str | None) -> str:
     candidate = (value or "").strip().lower()
     if not candidate:
         return "auto"
 
-    aliases = {
-        "english": "en",
-        "korean": "ko",
-        "japanese": "ja",
-        "chinese": "zh-cn",
-        "chinese-simplified": "zh-cn",
-        "chinese-traditional": "zh-tw",
-        "spanish": "es",
-        "french": "fr",
-        "german": "de",
-        "portuguese": "pt-br",
-        "portuguese-br": "pt-br",
-        "italian": "it",
-        "russian": "ru",
-        "arabic": "ar",
-        "hindi": "hi",
-        "vietnamese": "vi",
-        "thai": "th",
-        "indonesian": "id",
-        "turkish": "tr",
-        "dutch": "nl",
-        "polish": "pl",
-        "zh_cn": "zh-cn",
-        "zh_tw": "zh-tw",
-        "pt_br": "pt-br",
-    }
-    normalized = aliases.get(candidate, candidate)
+    normalized = LANGUAGE_ALIASES.get(candidate, candidate)
     if normalized in SUPPORTED_LANGUAGE_CODES:
         return normalized
     return "auto"
@@ -76,6 +76,9 @@ class OnboardingService:
             )
         ).all()
         site_ids = [row.id for row in sites if row.id is not None]
+        # Filter by a subquery so the database semi-joins instead of receiving
+        # every site id as a bound parameter.
+        org_site_ids = select(Site.id).where(Site.org_id == org_id)
         primary_site_id = site_ids[0] if site_ids else None
 
         site_count = len(site_ids)
@@ -95,7 +98,7 @@ class OnboardingService:
                     await session.exec(
                         select(func.count())
                         .select_from(BotVisit)
-                        .where(BotVisit.site_id.in_(site_ids))
+                        .where(BotVisit.site_id.in_(org_site_ids))
                     )
                 ).one()
                 or 0
@@ -105,7 +108,7 @@ class OnboardingService:
                     await session.exec(
                         select(func.count())
                         .select_from(BridgeEvent)
-                        .where(BridgeEvent.site_id.in_(site_ids))
+                        .where(BridgeEvent.site_id.in_(org_site_ids))
                     )
                 ).one()
                 or 0
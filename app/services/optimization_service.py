@@ -1,7 +1,8 @@
 import json
 from datetime import datetime
-from typing import Any
+from typing import Any, AsyncIterator
 
+import orjson
 from sqlmodel import and_, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -14,7 +15,13 @@ from app.models.innovation_plus import OptimizationBanditArm
 from app.services.bandit_service import bandit_service
 
 
+class OptimizationServiceError(ValueError):
+    """Expected failure raised by the optimization loop services."""
+
+
 class OptimizationService:
+    EVALUATE_BATCH_SIZE = 500
+
     def _parse_json_dict(self, raw: str | None) -> dict[str, Any]:
         if not raw:
             return {}
@@ -65,8 +72,8 @@ class OptimizationService:
             return []
 
         try:
-            analysis = json.loads(site.ai_analysis_json)
-        except Exception:
+            analysis = orjson.loads(site.ai_analysis_json)
+        except orjson.JSONDecodeError:
             return []
 
         recommendations = analysis.get("recommendations", [])
@@ -83,13 +90,7 @@ class OptimizationService:
     def _build_instruction(self, recommendation: str) -> str:
         return f"Prioritize this optimization on the next scan: {recommendation}"
 
-    async def list_actions(
-        self,
-        session: AsyncSession,
-        site_id: int,
-        org_id: int,
-        include_closed: bool = False,
-    ) -> list[OptimizationAction]:
+    def _list_actions_query(self, site_id: int, org_id: int, include_closed: bool):
         query = select(OptimizationAction).where(
             and_(
                 OptimizationAction.site_id == site_id,
@@ -98,10 +99,32 @@ class OptimizationService:
         )
         if not include_closed:
             query = query.where(OptimizationAction.status.in_(["pending", "approved", "applied"]))
-        query = query.order_by(OptimizationAction.created_at.desc())
-        result = await session.exec(query)
+        return query.order_by(OptimizationAction.created_at.desc())
+
+    async def list_actions(
+        self,
+        session: AsyncSession,
+        site_id: int,
+        org_id: int,
+        include_closed: bool = False,
+    ) -> list[OptimizationAction]:
+        result = await session.exec(self._list_actions_query(site_id, org_id, include_closed))
         return result.all()
 
+    async def stream_actions(
+        self,
+        session: AsyncSession,
+        site_id: int,
+        org_id: int,
+        include_closed: bool = False,
+        batch_size: int = 200,
+    ) -> AsyncIterator[list[OptimizationAction]]:
+        """Yield actions in batches from a server-side cursor, same order as list_actions."""
+        query = self._list_actions_query(site_id, org_id, include_closed)
+        result = await session.stream_scalars(query.execution_options(yield_per=batch_size))
+        async for partition in result.partitions(batch_size):
+            yield partition
+
     async def generate_actions_for_site(
         self,
         session: AsyncSession,
@@ -197,7 +220,7 @@ class OptimizationService:
             action.updated_at = datetime.utcnow()
             session.add(action)
             await session.commit()
-            raise ValueError("Site not found for action")
+            raise OptimizationServiceError("Site not found for action")
 
         action.status = "approved"
         action.decided_by_user_id = user_id
@@ -240,32 +263,61 @@ class OptimizationService:
         Periodically checks applied actions and awards rewards if Proof Scores improve.
         Returns count of actions evaluated.
         """
-        actions = (
+        evaluated_count = 0
+        last_seen_id = 0
+        while True:
+            # Keyset-paged batches keep memory bounded regardless of org size and
+            # stay valid across the per-batch commits below.
+            actions = (
+                await session.exec(
+                    select(OptimizationAction)
+                    .where(
+                        and_(
+                            OptimizationAction.org_id == org_id,
+                            OptimizationAction.status == "applied",
+                            OptimizationAction.id > last_seen_id,
+                        )
+                    )
+                    .order_by(OptimizationAction.id.asc())
+                    .limit(self.EVALUATE_BATCH_SIZE)
+                )
+            ).all()
+            if not actions:
+                break
+            last_seen_id = actions[-1].id
+
+            evaluated_count += await self._evaluate_applied_batch(session, org_id, actions)
+            await session.commit()
+            if len(actions) < self.EVALUATE_BATCH_SIZE:
+                break
+
+        return evaluated_count
+
+    async def _evaluate_applied_batch(
+        self,
+        session: AsyncSession,
+        org_id: int,
+        actions: list[OptimizationAction],
+    ) -> int:
+        action_ids = [action.id for action in actions if action.id is not None]
+        arm_rows = (
             await session.exec(
-                select(OptimizationAction).where(
+                select(OptimizationBanditArm).where(
                     and_(
-                        OptimizationAction.org_id == org_id,
-                        OptimizationAction.status == "applied",
+                        OptimizationBanditArm.org_id == org_id,
+                        OptimizationBanditArm.action_id.in_(action_ids),
                     )
                 )
             )
         ).all()
+        arm_by_action_id = {row.action_id: row for row in arm_rows}
 
         evaluated_count = 0
         for action in actions:
             if not action.applied_at or action.id is None:
                 continue
 
-            arm = (
-                await session.exec(
-                    select(OptimizationBanditArm).where(
-                        and_(
-                            OptimizationBanditArm.org_id == org_id,
-                            OptimizationBanditArm.action_id == action.id,
-                        )
-                    )
-                )
-            ).first()
+            arm = arm_by_action_id.get(action.id)
             arm_meta = self._parse_json_dict(arm.metadata_json if arm else None)
             auto_eval_meta = arm_meta.get("auto_eval", {}) if isinstance(arm_meta.get("auto_eval"), dict) else {}
             if auto_eval_meta.get("post_snapshot_id") is not None:
@@ -331,7 +383,6 @@ class OptimizationService:
             }
             updated_arm.metadata_json = json.dumps(updated_arm_meta, ensure_ascii=True)
             session.add(updated_arm)
-            await session.commit()
             evaluated_count += 1
 
         return evaluated_count
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import heapq
 import json
 from collections import defaultdict
 from datetime import datetime, timedelta
+from operator import itemgetter
 from typing import Any, Optional
 
 from sqlmodel import and_, select
@@ -120,11 +122,10 @@ class ProofService:
         for row in event_rows:
             if row.source_type == "ai" and row.source_bot_name:
                 by_bot[row.source_bot_name] += 1
-        top_ai_bots = sorted(
-            [{"bot_name": bot, "count": count} for bot, count in by_bot.items()],
-            key=lambda x: x["count"],
-            reverse=True,
-        )[:8]
+        top_ai_bots = [
+            {"bot_name": bot, "count": count}
+            for bot, count in heapq.nlargest(8, by_bot.items(), key=itemgetter(1))
+        ]
 
         proof_score = round(
             min(
@@ -242,8 +243,8 @@ class ProofService:
 
         selected_query_set_id = query_set_id
         if selected_query_set_id is None:
-            ranked = sorted(grouped.items(), key=lambda x: len(x[1]), reverse=True)
-            selected_query_set_id = ranked[0][0] if ranked else None
+            busiest = max(grouped.items(), key=lambda x: len(x[1]), default=None)
+            selected_query_set_id = busiest[0] if busiest else None
 
         if selected_query_set_id is None or len(grouped.get(selected_query_set_id, [])) < 2:
             return {
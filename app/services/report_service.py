@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import heapq
 from collections import defaultdict
 from datetime import datetime, timedelta
+from operator import itemgetter
 from typing import Any
 
 from sqlmodel import and_, func, select
@@ -52,46 +54,53 @@ class ReportService:
             )
         ).all()
         site_ids = [row.id for row in sites if row.id is not None]
+        # Filter by a subquery so the database semi-joins instead of receiving
+        # every site id as a bound parameter.
+        org_site_ids = select(Site.id).where(Site.org_id == org_id)
 
-        bot_rows = []
-        bridge_rows = []
+        # Aggregate in SQL: the summary only needs per-bot counts, so avoid
+        # hydrating every visit/event row for the day.
+        bot_counts: list[tuple[str, int]] = []
+        bridge_event_count = 0
         if site_ids:
-            bot_rows = (
+            bot_counts = (
                 await session.exec(
-                    select(BotVisit).where(
+                    select(BotVisit.bot_name, func.count())
+                    .where(
                         and_(
-                            BotVisit.site_id.in_(site_ids),
+                            BotVisit.site_id.in_(org_site_ids),
                             BotVisit.timestamp >= day_start,
                             BotVisit.timestamp < day_end,
                         )
                     )
+                    .group_by(BotVisit.bot_name)
                 )
             ).all()
-            bridge_rows = (
-                await session.exec(
-                    select(BridgeEvent).where(
+            bridge_event_count = (
+                await session.scalar(
+                    select(func.count()).select_from(BridgeEvent).where(
                         and_(
-                            BridgeEvent.site_id.in_(site_ids),
+                            BridgeEvent.site_id.in_(org_site_ids),
                             BridgeEvent.timestamp >= day_start,
                             BridgeEvent.timestamp < day_end,
                         )
                     )
                 )
-            ).all()
-
-        ai_crawler_visits = len([row for row in bot_rows if row.bot_name != "Human/Browser"])
-        human_visits = len([row for row in bot_rows if row.bot_name == "Human/Browser"])
-        bridge_event_count = len(bridge_rows)
+            ) or 0
 
+        human_visits = 0
         by_bot: dict[str, int] = defaultdict(int)
-        for row in bot_rows:
-            if row.bot_name != "Human/Browser":
-                by_bot[row.bot_name] += 1
-        top_bots = sorted(
-            [{"name": name, "count": count} for name, count in by_bot.items()],
-            key=lambda x: x["count"],
-            reverse=True,
-        )[:8]
+        for bot_name, count in bot_counts:
+            if bot_name == "Human/Browser":
+                human_visits += count
+            else:
+                by_bot[bot_name] += count
+        ai_crawler_visits = sum(by_bot.values())
+
+        top_bots = [
+            {"name": name, "count": count}
+            for name, count in heapq.nlargest(8, by_bot.items(), key=itemgetter(1))
+        ]
 
         avg_score = (
             round(sum(int(row.ai_score or 0) for row in sites) / len(sites), 1)
@@ -1,5 +1,8 @@
+import asyncio
+import time
 from typing import Optional, List
 from datetime import datetime, timedelta
+from fastapi import BackgroundTasks
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel import select, and_, func
 from app.models.billing import Subscription, SubscriptionStatus, UsageRecord, Invoice
@@ -17,6 +20,17 @@ import logging
 logger = logging.getLogger(__name__)
 
 class SubscriptionService:
+    # Upcoming invoices come from a Stripe API call, so keep them per customer
+    # and serve stale-while-revalidate: fresh for 2 minutes, then served while
+    # a background refresh runs, and refetched inline after 5 minutes.
+    UPCOMING_INVOICE_FRESH_SECONDS = 120.0
+    UPCOMING_INVOICE_MAX_AGE_SECONDS = 300.0
+    UPCOMING_INVOICE_CACHE_MAX = 1_000
+
+    def __init__(self):
+        self._upcoming_invoice_cache: dict[str, tuple[Optional[dict], float]] = {}
+        self._upcoming_invoice_refreshing: set[str] = set()
+
     async def get_or_create_subscription(
         self, 
         session: AsyncSession, 
@@ -46,6 +60,7 @@ class SubscriptionService:
         stripe_subscription: dict
     ) -> Subscription:
         subscription = await self.get_or_create_subscription(session, org_id)
+        previous_customer_id = subscription.stripe_customer_id
         
         subscription.stripe_subscription_id = stripe_subscription.get("id")
         subscription.stripe_customer_id = stripe_subscription.get("customer")
@@ -90,6 +105,8 @@ class SubscriptionService:
         session.add(subscription)
         await session.commit()
         await session.refresh(subscription)
+        self.invalidate_upcoming_invoice(previous_customer_id)
+        self.invalidate_upcoming_invoice(subscription.stripe_customer_id)
         
         return subscription
     
@@ -105,6 +122,7 @@ class SubscriptionService:
         session.add(subscription)
         await session.commit()
         await session.refresh(subscription)
+        self.invalidate_upcoming_invoice(subscription.stripe_customer_id)
         return subscription
     
     async def check_quota(
@@ -280,38 +298,79 @@ class SubscriptionService:
             
         return None
     
+    def _format_upcoming_invoice(self, invoice) -> Optional[dict]:
+        if not invoice:
+            return None
+        return {
+            "amount_due": invoice.amount_due,
+            "currency": invoice.currency,
+            "period_start": datetime.fromtimestamp(invoice.period_start),
+            "period_end": datetime.fromtimestamp(invoice.period_end),
+            "lines": [
+                {
+                    "description": line.description,
+                    "amount": line.amount,
+                    "period": {
+                        "start": datetime.fromtimestamp(line.period.start),
+                        "end": datetime.fromtimestamp(line.period.end)
+                    }
+                }
+                for line in invoice.lines.data
+            ]
+        }
+
+    async def _fetch_upcoming_invoice(self, customer_id: str) -> Optional[dict]:
+        # The Stripe SDK is blocking; keep it off the event loop.
+        invoice = await asyncio.to_thread(stripe_service.get_upcoming_invoice, customer_id)
+        upcoming = self._format_upcoming_invoice(invoice)
+        if (
+            customer_id not in self._upcoming_invoice_cache
+            and len(self._upcoming_invoice_cache) >= self.UPCOMING_INVOICE_CACHE_MAX
+        ):
+            self._upcoming_invoice_cache.clear()
+        self._upcoming_invoice_cache[customer_id] = (upcoming, time.monotonic())
+        return upcoming
+
+    def invalidate_upcoming_invoice(self, customer_id: Optional[str]) -> None:
+        # Plan, cancel and reactivate changes alter the next invoice.
+        if customer_id:
+            self._upcoming_invoice_cache.pop(customer_id, None)
+
+    async def refresh_upcoming_invoice(self, customer_id: str) -> None:
+        if customer_id in self._upcoming_invoice_refreshing:
+            return
+        self._upcoming_invoice_refreshing.add(customer_id)
+        try:
+            await self._fetch_upcoming_invoice(customer_id)
+        except Exception as e:
+            logger.error("Error refreshing upcoming invoice: %s", e)
+        finally:
+            self._upcoming_invoice_refreshing.discard(customer_id)
+
     async def get_upcoming_invoice(
         self,
         session: AsyncSession,
-        org_id: int
+        org_id: int,
+        background_tasks: Optional[BackgroundTasks] = None,
     ) -> Optional[dict]:
         subscription = await self.get_or_create_subscription(session, org_id)
         
         if not subscription.stripe_customer_id:
             return None
-            
+
+        customer_id = subscription.stripe_customer_id
+        cached = self._upcoming_invoice_cache.get(customer_id)
+        if cached is not None:
+            upcoming, fetched_at = cached
+            age = time.monotonic() - fetched_at
+            if age < self.UPCOMING_INVOICE_FRESH_SECONDS:
+                return upcoming
+            if age < self.UPCOMING_INVOICE_MAX_AGE_SECONDS and background_tasks is not None:
+                background_tasks.add_task(self.refresh_upcoming_invoice, customer_id)
+                return upcoming
+
         try:
-            invoice = stripe_service.get_upcoming_invoice(
-                subscription.stripe_customer_id
-            )
-            if invoice:
-                return {
-                    "amount_due": invoice.amount_due,
-                    "currency": invoice.currency,
-                    "period_start": datetime.fromtimestamp(invoice.period_start),
-                    "period_end": datetime.fromtimestamp(invoice.period_end),
-                    "lines": [
-                        {
-                            "description": line.description,
-                            "amount": line.amount,
-                            "period": {
-                                "start": datetime.fromtimestamp(line.period.start),
-                                "end": datetime.fromtimestamp(line.period.end)
-                            }
-                        }
-                        for line in invoice.lines.data
-                    ]
-                }
+            return await self._fetch_upcoming_invoice(customer_id)
         except Exception as e:
             logger.error(f"Error getting upcoming invoice: {e}")
             
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Optional
 
 
@@ -29,6 +30,7 @@ def normalize_ui_language(code: Optional[str]) -> str:
     return "auto"
 
 
+@lru_cache(maxsize=1024)
 def resolve_ui_language(
     preferred_language: Optional[str],
     accept_language: Optional[str] = None,
@@ -1,6 +1,10 @@
 import asyncio
+import html
+import re
 import uuid
+from datetime import datetime, timedelta
 from types import SimpleNamespace
+from urllib.parse import parse_qs, urlsplit
 
 import pytest
 from fastapi.testclient import TestClient
@@ -11,6 +15,7 @@ from app.main import app
 from app.models.billing import Subscription
 from app.models.organization import Membership, Organization
 from app.models.user import User
+from app.routers.pages import _admin_next_page_href
 from app.routers.users import get_current_user
 
 
@@ -146,3 +151,62 @@ def test_org_admin_scope_only_shows_org_users(admin_prefix: str):
         assert response.status_code == 200
         assert owner_a in response.text
         assert owner_b not in response.text
+
+
+def test_admin_next_page_href_uses_last_row_as_keyset_cursor():
+    rows = [
+        SimpleNamespace(org_id=9, updated_at=datetime(2026, 3, 2, 10, 0, 0)),
+        SimpleNamespace(org_id=7, updated_at=datetime(2026, 3, 1, 8, 30, 15, 250000)),
+    ]
+
+    assert _admin_next_page_href(rows[:1], 2, "org", {"limit": 2}, id_field="org_id") is None
+
+    href = _admin_next_page_href(rows, 2, "org", {"q": "", "limit": 2, "org_id": None}, id_field="org_id")
+    parts = urlsplit(href)
+    assert parts.path == "/admin"
+    assert parse_qs(parts.query) == {
+        "limit": ["2"],
+        "org_after_updated_at": ["2026-03-01T08:30:15.250000"],
+        "org_after_id": ["7"],
+    }
+
+
+def test_admin_user_pages_follow_next_cursor_without_overlap(admin_prefix: str):
+    async def _seed() -> None:
+        async for session in get_session():
+            base = datetime(2026, 1, 1)
+            for index in range(25):
+                # Pairs share a timestamp so the id tie-breaker is exercised.
+                session.add(
+                    User(
+                        email=f"{admin_prefix}u{index:02d}@example.com",
+                        hashed_password="x",
+                        updated_at=base + timedelta(minutes=index // 2),
+                    )
+                )
+            await session.commit()
+            break
+
+    asyncio.run(_seed())
+    seeded = {f"{admin_prefix}u{index:02d}@example.com" for index in range(25)}
+
+    app.dependency_overrides[get_current_user] = _superuser
+    try:
+        with TestClient(app) as client:
+            first = client.get("/admin", params={"q": admin_prefix, "limit": 20})
+            assert first.status_code == 200
+            first_page = {email for email in seeded if email in first.text}
+            assert len(first_page) == 20
+
+            next_link = re.compile(r'href="(/admin\?[^"]*user_after_id=[^"]*)"')
+            match = next_link.search(first.text)
+            assert match is not None
+            second = client.get(html.unescape(match.group(1)))
+            assert second.status_code == 200
+            second_page = {email for email in seeded if email in second.text}
+            assert next_link.search(second.text) is None
+    finally:
+        app.dependency_overrides.pop(get_current_user, None)
+
+    assert first_page.isdisjoint(second_page)
+    assert first_page | second_page == seeded
@@ -0,0 +1,184 @@
+import asyncio
+import time
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import delete, select
+
+from app.core import rbac
+from app.db.engine import async_session_factory
+from app.main import app
+from app.models.approval import ApprovalRequest
+from app.models.audit_log import AuditLog
+from app.models.organization import Membership, Organization
+from app.models.user import User
+from app.routers.users import get_current_user
+from app.services.approval_service import approval_service
+from app.services.subscription_service import SubscriptionService
+
+
+class _Result:
+    def __init__(self, value):
+        self._value = value
+
+    def first(self):
+        return self._value
+
+
+class _RoleSession:
+    def __init__(self, role):
+        self.role = role
+        self.queries = 0
+
+    async def exec(self, _query):
+        self.queries += 1
+        return _Result(self.role)
+
+
+async def _seed_org(prefix: str) -> tuple[int, int, int]:
+    async with async_session_factory() as session:
+        owner = User(email=f"{prefix}owner@example.com", full_name="Owner", hashed_password="x")
+        member = User(email=f"{prefix}member@example.com", full_name="Member", hashed_password="x")
+        org = Organization(name=f"{prefix} Org", slug=f"{prefix}org", billing_email=f"{prefix}billing@example.com")
+        session.add_all([owner, member, org])
+        await session.commit()
+
+        session.add_all(
+            [
+                Membership(org_id=org.id, user_id=owner.id, role="owner"),
+                Membership(org_id=org.id, user_id=member.id, role="admin"),
+            ]
+        )
+        await session.commit()
+        return org.id, owner.id, member.id
+
+
+async def _cleanup(prefix: str) -> None:
+    async with async_session_factory() as session:
+        users = (await session.exec(select(User).where(User.email.like(f"{prefix}%@example.com")))).all()
+        orgs = (await session.exec(select(Organization).where(Organization.slug.like(f"{prefix}%")))).all()
+        org_ids = [org.id for org in orgs]
+        if org_ids:
+            await session.exec(delete(ApprovalRequest).where(ApprovalRequest.org_id.in_(org_ids)))
+            await session.exec(delete(AuditLog).where(AuditLog.org_id.in_(org_ids)))
+            await session.exec(delete(Membership).where(Membership.org_id.in_(org_ids)))
+        for row in [*users, *orgs]:
+            await session.delete(row)
+        await session.commit()
+
+
+@pytest.fixture
+def cache_prefix() -> str:
+    prefix = f"pytest_cache_{uuid.uuid4().hex[:8]}_"
+    try:
+        yield prefix
+    finally:
+        asyncio.run(_cleanup(prefix))
+
+
+def test_role_cache_serves_repeat_reads_until_invalidated():
+    org_id, user_id = 900001, 900002
+    rbac.invalidate_membership_role(org_id, user_id)
+    session = _RoleSession("admin")
+
+    async def _run():
+        assert await rbac.get_membership_role(session, org_id, user_id) == "admin"
+        assert await rbac.get_membership_role(session, org_id, user_id) == "admin"
+        assert session.queries == 1
+
+        # Mutating endpoints bypass the cache but still refresh it.
+        session.role = "member"
+        assert await rbac.get_membership_role(session, org_id, user_id, use_cache=False) == "member"
+        assert session.queries == 2
+        assert rbac.cached_membership_role(org_id, user_id) == "member"
+
+        rbac.invalidate_membership_role(org_id, user_id)
+        session.role = None
+        assert await rbac.get_membership_role(session, org_id, user_id) is None
+        assert session.queries == 3
+        # Misses are never cached.
+        assert rbac.cached_membership_role(org_id, user_id) is None
+
+    asyncio.run(_run())
+
+
+def test_member_removal_invalidates_cached_role(cache_prefix: str):
+    org_id, owner_id, member_id = asyncio.run(_seed_org(cache_prefix))
+    rbac.remember_membership_role(org_id, member_id, "admin")
+
+    async def _owner():
+        return SimpleNamespace(id=owner_id, email=f"{cache_prefix}owner@example.com", is_superuser=False)
+
+    app.dependency_overrides[get_current_user] = _owner
+    try:
+        with TestClient(app) as client:
+            response = client.delete(f"/api/organizations/{org_id}/members/{member_id}")
+    finally:
+        app.dependency_overrides.pop(get_current_user, None)
+
+    assert response.status_code == 200
+    assert rbac.cached_membership_role(org_id, member_id) is None
+
+
+def test_approval_writes_invalidate_status_counts(cache_prefix: str):
+    org_id, owner_id, _member_id = asyncio.run(_seed_org(cache_prefix))
+
+    async def _run():
+        async with async_session_factory() as session:
+            reviewer = await session.get(User, owner_id)
+            assert (await approval_service.status_counts(session, org_id))["pending"] == 0
+
+            created = await approval_service.create_request(
+                session=session,
+                org_id=org_id,
+                request_type="billing_cancel",
+                payload={"at_period_end": True},
+                requested_by_user_id=owner_id,
+            )
+            counts = await approval_service.status_counts(session, org_id)
+            assert counts["pending"] == 1
+            assert counts["all"] == 1
+
+            await approval_service.reject_request(session=session, request_row=created, reviewer=reviewer)
+            counts = await approval_service.status_counts(session, org_id)
+            assert counts["pending"] == 0
+            assert counts["rejected"] == 1
+
+    asyncio.run(_run())
+
+
+class _WriteSession:
+    def add(self, _row):
+        pass
+
+    async def commit(self):
+        pass
+
+    async def refresh(self, _row):
+        pass
+
+
+def test_subscription_writes_invalidate_upcoming_invoice(monkeypatch):
+    service = SubscriptionService()
+    subscription = SimpleNamespace(stripe_customer_id="cus_old", plan_code="starter", link_limit=0)
+
+    async def _get_subscription(_session, _org_id):
+        return subscription
+
+    monkeypatch.setattr(service, "get_or_create_subscription", _get_subscription)
+
+    async def _run():
+        service._upcoming_invoice_cache["cus_old"] = ({"amount_due": 100}, time.monotonic())
+        await service.set_plan(_WriteSession(), 1, "free")
+        assert "cus_old" not in service._upcoming_invoice_cache
+
+        service._upcoming_invoice_cache["cus_old"] = ({"amount_due": 100}, time.monotonic())
+        service._upcoming_invoice_cache["cus_new"] = ({"amount_due": 200}, time.monotonic())
+        await service.update_subscription_from_stripe(
+            _WriteSession(), 1, {"id": "sub_1", "customer": "cus_new", "status": "active", "cancel_at_period_end": True}
+        )
+        assert service._upcoming_invoice_cache == {}
+
+    asyncio.run(_run())
@@ -0,0 +1,137 @@
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlmodel import delete, select
+
+from app.db.engine import async_session_factory
+from app.models.analytics import BotVisit
+from app.models.organization import Organization
+from app.models.site import Site
+from app.models.user import User
+from app.routers.pages import _aggregate_dashboard_visits, _empty_visit_stats
+
+
+NOW = datetime(2026, 3, 15, 12, 0, 0)
+
+# (bot_name, age) pairs spread over every window, including visits just
+# inside and just outside the 7/14/30 day edges.
+VISITS = [
+    ("GPTBot", timedelta(minutes=5)),
+    ("GPTBot", timedelta(hours=13)),
+    ("GPTBot", timedelta(days=2, hours=3)),
+    ("GPTBot", timedelta(days=7) - timedelta(minutes=1)),
+    ("GPTBot", timedelta(days=7, minutes=1)),
+    ("GPTBot", timedelta(days=40)),
+    ("ClaudeBot", timedelta(hours=1)),
+    ("ClaudeBot", timedelta(days=1, hours=2)),
+    ("ClaudeBot", timedelta(days=13, hours=23)),
+    ("ClaudeBot", timedelta(days=29, hours=23)),
+    ("PerplexityBot", timedelta(days=20)),
+    ("PerplexityBot", timedelta(days=30, minutes=1)),
+    ("Google-Extended", timedelta(days=3)),
+    ("Google-Extended", timedelta(days=3, hours=5)),
+    ("Human/Browser", timedelta(hours=2)),
+    ("Human/Browser", timedelta(days=6)),
+    ("Human/Browser", timedelta(days=10)),
+    ("Human/Browser", timedelta(days=25)),
+    ("Human/Browser", timedelta(days=90)),
+]
+
+
+async def _seed(prefix: str) -> int:
+    async with async_session_factory() as session:
+        user = User(email=f"{prefix}user@example.com", hashed_password="x")
+        org = Organization(name=f"{prefix} Org", slug=f"{prefix}org", billing_email=f"{prefix}billing@example.com")
+        other_org = Organization(name=f"{prefix} Other", slug=f"{prefix}other", billing_email=f"{prefix}other@example.com")
+        session.add_all([user, org, other_org])
+        await session.commit()
+
+        sites = [
+            Site(org_id=org.id, owner_id=user.id, url=f"https://{prefix}a.example.com", status="active"),
+            Site(org_id=org.id, owner_id=user.id, url=f"https://{prefix}b.example.com", status="active"),
+            Site(org_id=other_org.id, owner_id=user.id, url=f"https://{prefix}c.example.com", status="active"),
+        ]
+        session.add_all(sites)
+        await session.commit()
+
+        for index, (bot_name, age) in enumerate(VISITS):
+            session.add(
+                BotVisit(
+                    site_id=sites[index % 2].id,
+                    bot_name=bot_name,
+                    user_agent=bot_name,
+                    timestamp=NOW - age,
+                )
+            )
+        # Another org's traffic must not leak into the aggregate.
+        session.add(BotVisit(site_id=sites[2].id, bot_name="GPTBot", user_agent="GPTBot", timestamp=NOW))
+        await session.commit()
+        return org.id
+
+
+async def _cleanup(prefix: str) -> None:
+    async with async_session_factory() as session:
+        org_ids = (await session.exec(select(Organization.id).where(Organization.slug.like(f"{prefix}%")))).all()
+        if org_ids:
+            site_ids = (await session.exec(select(Site.id).where(Site.org_id.in_(org_ids)))).all()
+            if site_ids:
+                await session.exec(delete(BotVisit).where(BotVisit.site_id.in_(site_ids)))
+            await session.exec(delete(Site).where(Site.org_id.in_(org_ids)))
+            await session.exec(delete(Organization).where(Organization.id.in_(org_ids)))
+        await session.exec(delete(User).where(User.email.like(f"{prefix}%@example.com")))
+        await session.commit()
+
+
+@pytest.fixture
+def visits_prefix() -> str:
+    prefix = f"pytest_visits_{uuid.uuid4().hex[:8]}_"
+    try:
+        yield prefix
+    finally:
+        asyncio.run(_cleanup(prefix))
+
+
+def _per_visit_stats(visits: list[tuple[str, datetime]]) -> dict:
+    # Mirrors the dashboard before the grouped query: COUNTs for the totals,
+    # then a pass over every hydrated visit for the windows and the chart.
+    expected = _empty_visit_stats(NOW)
+    seven_days_ago = NOW - timedelta(days=7)
+    fourteen_days_ago = NOW - timedelta(days=14)
+    thirty_days_ago = NOW - timedelta(days=30)
+
+    for bot_name, timestamp in visits:
+        is_human = bot_name == "Human/Browser"
+        expected["total_human_visits" if is_human else "total_ai_impressions"] += 1
+        if timestamp < thirty_days_ago:
+            continue
+        if not is_human:
+            expected["bot_counts"][bot_name] = expected["bot_counts"].get(bot_name, 0) + 1
+        if timestamp >= seven_days_ago:
+            expected["human_visits_7d" if is_human else "ai_crawler_visits_7d"] += 1
+            date_str = timestamp.strftime("%Y-%m-%d")
+            if not is_human and date_str in expected["chart_data"]:
+                expected["chart_data"][date_str] += 1
+        elif timestamp >= fourteen_days_ago:
+            expected["human_visits_prev_7d" if is_human else "ai_crawler_visits_prev_7d"] += 1
+    return expected
+
+
+def test_grouped_visit_aggregate_matches_per_visit_counts(visits_prefix: str):
+    org_id = asyncio.run(_seed(visits_prefix))
+
+    async def _run():
+        async with async_session_factory() as session:
+            return await _aggregate_dashboard_visits(session, org_id, NOW)
+
+    stats = asyncio.run(_run())
+    expected = _per_visit_stats([(bot_name, NOW - age) for bot_name, age in VISITS])
+
+    assert stats == expected
+    assert stats["total_ai_impressions"] == 14
+    assert stats["bot_counts"] == {"GPTBot": 5, "ClaudeBot": 4, "PerplexityBot": 1, "Google-Extended": 2}
+    # The 7d window starts mid-day, so its oldest visit falls before the first chart day.
+    assert stats["ai_crawler_visits_7d"] == 8
+    assert stats["chart_data"]["2026-03-15"] == 2
+    assert sum(stats["chart_data"].values()) == 7
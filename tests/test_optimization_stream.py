@@ -0,0 +1,109 @@
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+
+import orjson
+import pytest
+from sqlmodel import delete, select
+
+from app.db.engine import async_session_factory
+from app.models.optimization import OptimizationAction
+from app.models.organization import Organization
+from app.models.site import Site
+from app.models.user import User
+from app.routers.optimizations import _serialize_action, _stream_actions_json
+from app.services.optimization_service import optimization_service
+
+
+async def _seed(prefix: str, statuses: list[str]) -> tuple[int, int, int]:
+    async with async_session_factory() as session:
+        user = User(email=f"{prefix}user@example.com", hashed_password="x")
+        org = Organization(name=f"{prefix} Org", slug=f"{prefix}org", billing_email=f"{prefix}billing@example.com")
+        session.add_all([user, org])
+        await session.commit()
+
+        site = Site(org_id=org.id, owner_id=user.id, url=f"https://{prefix}.example.com", status="active")
+        empty_site = Site(org_id=org.id, owner_id=user.id, url=f"https://{prefix}empty.example.com", status="active")
+        session.add_all([site, empty_site])
+        await session.commit()
+
+        base = datetime(2026, 2, 1)
+        for index, status in enumerate(statuses):
+            session.add(
+                OptimizationAction(
+                    site_id=site.id,
+                    org_id=org.id,
+                    title=f"Action {index}",
+                    proposed_instruction=f"Instruction {index}",
+                    status=status,
+                    created_at=base + timedelta(hours=index),
+                )
+            )
+        await session.commit()
+        return org.id, site.id, empty_site.id
+
+
+async def _cleanup(prefix: str) -> None:
+    async with async_session_factory() as session:
+        org_ids = (await session.exec(select(Organization.id).where(Organization.slug.like(f"{prefix}%")))).all()
+        if org_ids:
+            await session.exec(delete(OptimizationAction).where(OptimizationAction.org_id.in_(org_ids)))
+            await session.exec(delete(Site).where(Site.org_id.in_(org_ids)))
+            await session.exec(delete(Organization).where(Organization.id.in_(org_ids)))
+        await session.exec(delete(User).where(User.email.like(f"{prefix}%@example.com")))
+        await session.commit()
+
+
+@pytest.fixture
+def stream_prefix() -> str:
+    prefix = f"pytest_stream_{uuid.uuid4().hex[:8]}_"
+    try:
+        yield prefix
+    finally:
+        asyncio.run(_cleanup(prefix))
+
+
+async def _collect_body(site_id: int, org_id: int, include_closed: bool) -> dict:
+    chunks = [chunk async for chunk in _stream_actions_json(site_id, org_id, include_closed)]
+    return orjson.loads(b"".join(chunks))
+
+
+def test_stream_actions_batches_match_list_actions(stream_prefix: str):
+    statuses = ["pending", "approved", "rejected", "applied", "pending", "failed", "pending"]
+    org_id, site_id, _empty_site_id = asyncio.run(_seed(stream_prefix, statuses))
+
+    async def _run():
+        async with async_session_factory() as session:
+            for include_closed in (False, True):
+                expected = await optimization_service.list_actions(session, site_id, org_id, include_closed)
+                batches = [
+                    batch
+                    async for batch in optimization_service.stream_actions(
+                        session, site_id, org_id, include_closed, batch_size=2
+                    )
+                ]
+                assert all(0 < len(batch) <= 2 for batch in batches)
+                assert [action.id for batch in batches for action in batch] == [action.id for action in expected]
+            assert len(expected) == len(statuses)
+
+    asyncio.run(_run())
+
+
+def test_stream_actions_json_matches_list_payload(stream_prefix: str):
+    statuses = ["pending", "rejected", "applied"]
+    org_id, site_id, empty_site_id = asyncio.run(_seed(stream_prefix, statuses))
+
+    async def _run():
+        async with async_session_factory() as session:
+            expected = await optimization_service.list_actions(session, site_id, org_id)
+
+        body = await _collect_body(site_id, org_id, include_closed=False)
+        assert body["site_id"] == site_id
+        assert body["org_id"] == org_id
+        assert body["actions"] == [orjson.loads(orjson.dumps(_serialize_action(action))) for action in expected]
+        assert [action["status"] for action in body["actions"]] == ["applied", "pending"]
+
+        empty = await _collect_body(empty_site_id, org_id, include_closed=True)
+        assert empty == {"site_id": empty_site_id, "org_id": org_id, "actions": []}
+
+    asyncio.run(_run())